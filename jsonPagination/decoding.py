@@ -0,0 +1,17 @@
+"""
+Selects the fastest JSON decoder available: orjson, then ujson, then the standard library.
+
+All of them accept the raw bytes of a response body and raise a ValueError subclass on invalid
+input, so callers can use `loads` interchangeably.
+"""
+
+try:
+    import orjson
+    loads = orjson.loads
+except ImportError:  # Optional dependency, faster JSON decoding
+    try:
+        import ujson  # Already installed in many environments, still faster than json
+        loads = ujson.loads
+    except ImportError:  # Standard library fallback
+        import json
+        loads = json.loads
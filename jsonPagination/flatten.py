@@ -0,0 +1,173 @@
+"""
+Flattening of nested JSON objects into single-level dictionaries.
+
+Besides the generic iterative flattener, this module can compile a flattener specialized for
+the shape of a sample item. Paginated APIs usually return items sharing one schema, and the
+specialized function reads every leaf with direct subscripts instead of walking the structure.
+"""
+
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List
+
+_CONTAINERS = (dict, list)
+
+# Path segments for list indices, so flattening arrays does not stringify every index
+_INT_STR = tuple(map(str, range(4096)))
+
+# Below this many items, process start-up and pickling cost more than flattening in-process
+PARALLEL_THRESHOLD = 10_000
+
+# Below this many items, compiling a specialized flattener costs more than it saves
+SPECIALIZE_THRESHOLD = 64
+
+# Specialization is dropped if this many items in a row miss the compiled shape before any hit
+SPECIALIZE_PROBE = 4
+
+
+class _SchemaMismatch(Exception):
+    """Raised by a specialized flattener when an item does not have the compiled shape."""
+
+
+def flatten(y: Any) -> Dict[str, Any]:
+    """
+    Flattens a nested JSON object into a single level dictionary with keys as paths to nested
+    values, walking it iteratively with an explicit stack of (node, path) pairs.
+
+    Args:
+        y (dict or list): The JSON object (or a part of it) to be flattened.
+
+    Returns:
+        dict: A single-level dictionary where each key represents a path through the original
+              nested structure, and each value is the value at that path.
+    """
+    if isinstance(y, dict):
+        for key, value in y.items():
+            if not isinstance(key, str) or isinstance(value, _CONTAINERS):
+                break
+        else:
+            # Already flat with string keys, a copy has the same keys without walking every value
+            return y.copy()
+
+    flat: Dict[str, Any] = {}
+    stack = [(y, ())]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        node, path = pop()
+        if isinstance(node, dict):
+            # Push children in reverse so they are emitted in their original order
+            for key in reversed(node):
+                # Keys of dicts not decoded from JSON may be of any type, paths are joined as strings
+                push((node[key], path + (key if isinstance(key, str) else str(key),)))
+        elif isinstance(node, list):
+            for i in range(len(node) - 1, -1, -1):
+                push((node[i], path + (_INT_STR[i] if i < 4096 else str(i),)))
+        else:
+            flat['_'.join(path)] = node
+
+    return flat
+
+
+def compile_flattener(sample: Any) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Generates a flattener specialized for the shape of `sample`.
+
+    The generated function checks the type and length of every container and the type of every
+    leaf as it reads them, raising `_SchemaMismatch` (or `KeyError`) as soon as an item differs
+    from the sample, so it never silently drops or misplaces values.
+
+    Args:
+        sample (Any): An item whose shape the flattener is compiled for.
+
+    Returns:
+        function: A function flattening items shaped like `sample`.
+    """
+    lines = ['def specialized_flatten(n0):']
+    entries = []
+    names = itertools.count(1)
+
+    def walk(node: Any, var: str, path: tuple) -> None:
+        if isinstance(node, dict):
+            lines.append(f'    if type({var}) is not dict or len({var}) != {len(node)}: raise _SchemaMismatch')
+            children = ((repr(key), str(key), value) for key, value in node.items())
+        elif isinstance(node, list):
+            lines.append(f'    if type({var}) is not list or len({var}) != {len(node)}: raise _SchemaMismatch')
+            children = ((str(i), str(i), value) for i, value in enumerate(node))
+        else:
+            lines.append(f'    if isinstance({var}, _CONTAINERS): raise _SchemaMismatch')
+            entries.append(f'{"_".join(path)!r}: {var}')
+            return
+
+        for subscript, key, value in children:
+            child = f'n{next(names)}'
+            lines.append(f'    {child} = {var}[{subscript}]')
+            walk(value, child, path + (key,))
+
+    walk(sample, 'n0', ())
+    lines.append('    return {' + ', '.join(entries) + '}')
+
+    namespace = {'_SchemaMismatch': _SchemaMismatch, '_CONTAINERS': _CONTAINERS}
+    exec('\n'.join(lines), namespace)  # pylint: disable=exec-used
+    return namespace['specialized_flatten']
+
+
+def flatten_items(items: Iterable[Any], workers: int = 1) -> List[Dict[str, Any]]:
+    """
+    Flattens a sequence of items, using a flattener specialized for the first item's shape and
+    falling back to the generic `flatten` for items that diverge from it.
+
+    Short sequences go straight through the generic flattener. Specialization is abandoned once
+    diverging items become common, or right away if the first items after the sample all diverge,
+    as happens with lists of varying length, since each miss costs a partial specialized pass on
+    top of the generic one.
+
+    Args:
+        items (iterable): The items to flatten.
+        workers (int, optional): Number of processes to spread large lists over. Defaults to 1,
+                                 which flattens in the calling process.
+
+    Returns:
+        list: The flattened items, in order.
+    """
+    if not isinstance(items, list):
+        items = list(items)
+
+    if workers > 1 and len(items) >= PARALLEL_THRESHOLD:
+        # About four chunks per worker balances uneven chunks without paying per-chunk overhead
+        # (and a specialized flattener compile) more often than needed
+        chunksize = -(-len(items) // (workers * 4))
+        chunks = [items[i:i + chunksize] for i in range(0, len(items), chunksize)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Each worker specializes for its own chunk; map keeps the chunks in order
+            return [flat for chunk in executor.map(flatten_items, chunks) for flat in chunk]
+
+    if len(items) < SPECIALIZE_THRESHOLD:
+        return list(map(flatten, items))
+
+    flattened: List[Dict[str, Any]] = []
+    append = flattened.append
+    generic = flatten
+    iterator = iter(items)
+
+    for sample in iterator:
+        specialized = compile_flattener(sample)
+        append(specialized(sample))
+        break
+    else:
+        return flattened
+
+    misses = 0
+    for count, item in enumerate(iterator, 2):
+        try:
+            append(specialized(item))
+        except (_SchemaMismatch, KeyError):
+            append(generic(item))
+            misses += 1
+            # Also stop early when no item after the sample has matched, the shape varies per item
+            if misses > max(16, count // 10) or misses == count - 1 == SPECIALIZE_PROBE:
+                break
+
+    # Whatever is left once specialization is abandoned goes straight through the generic flattener
+    flattened.extend(map(generic, iterator))
+    return flattened
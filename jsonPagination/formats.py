@@ -0,0 +1,75 @@
+"""
+Conversion of fetched items into the result layouts supported by `Paginator`.
+
+Items are fetched as a list of dictionaries, one per row. For large result sets, a column
+oriented layout stores each field once as a list (or as a typed Arrow buffer) instead of
+repeating every key and per-dictionary overhead for every row.
+"""
+
+from typing import Any, Dict, List
+
+try:
+    import pyarrow
+except ImportError:  # Optional dependency, enables return_format='arrow'
+    pyarrow = None
+
+RETURN_FORMATS = ('list', 'soa', 'arrow')
+
+
+def check_return_format(return_format: str) -> None:
+    """
+    Validates a `return_format` before anything is fetched.
+
+    Args:
+        return_format (str): One of 'list', 'soa' or 'arrow'.
+
+    Raises:
+        ValueError: If the format is unknown.
+        ImportError: If 'arrow' is requested but pyarrow is not installed.
+    """
+    if return_format not in RETURN_FORMATS:
+        raise ValueError(f'Invalid return_format: {return_format}, expected one of {", ".join(RETURN_FORMATS)}.')
+    if return_format == 'arrow' and pyarrow is None:
+        raise ImportError("return_format='arrow' requires pyarrow, install jsonPagination[arrow].")
+
+
+def to_columns(items: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Converts a list of rows into a dictionary of columns.
+
+    Columns are ordered by first appearance of their key, and rows missing a key get None in
+    that column, so every column has one value per row.
+
+    Args:
+        items (list): The rows, as dictionaries.
+
+    Returns:
+        dict: A mapping of each key to the list of its values.
+    """
+    keys: Dict[str, None] = {}
+    for item in items:
+        if not isinstance(item, dict):
+            raise ValueError("return_format='soa' requires every item to be a JSON object.")
+        keys.update(dict.fromkeys(item))
+
+    return {key: [item.get(key) for item in items] for key in keys}
+
+
+def convert(items: List[Any], return_format: str) -> Any:
+    """
+    Converts fetched items into the requested layout.
+
+    Args:
+        items (list): The fetched (and possibly flattened) items.
+        return_format (str): 'list' returns the items unchanged, 'soa' a dictionary of columns
+                             and 'arrow' a `pyarrow.Table`.
+
+    Returns:
+        list, dict or pyarrow.Table: The items in the requested layout.
+    """
+    if return_format == 'soa':
+        return to_columns(items)
+    if return_format == 'arrow':
+        # from_pylist infers the schema once and packs each column into a contiguous buffer
+        return pyarrow.Table.from_pylist(items)
+    return items
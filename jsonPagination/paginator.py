@@ -3,29 +3,65 @@ A module for fetching and paginating JSON data from APIs with support for multit
 customizable authentication, and the option to disable SSL verification for HTTP requests.
 """
 
+import hashlib
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock, Semaphore
+import pickle
+import shelve
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import itertools
+from threading import BoundedSemaphore, Lock
 import time
-from urllib.parse import urljoin
+from urllib.parse import urlencode, urljoin
 from datetime import datetime, timedelta
-import math
+from functools import lru_cache
 from typing import Optional, Dict, Any, List, Callable
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 import urllib3
 from tqdm import tqdm
 
-from .exceptions import LoginFailedException, DataFetchFailedException, AuthenticationFailed
+try:
+    import ijson
+except ImportError:  # Optional dependency, enables streaming of large pages
+    ijson = None
 
+try:
+    import httpx
+except ImportError:  # Optional dependency, enables HTTP/2
+    httpx = None
 
-class Paginator:
+from .aio import AsyncFetchMixin
+from .decoding import loads as _loads
+from .exceptions import LoginFailedException, DataFetchFailedException
+from .flatten import flatten, flatten_items
+from .formats import check_return_format, convert
+from .ratelimit import SlidingWindowLimiter
+from .retry import MAX_LOGGED_BODY, PageRetry, retry_after_delay
+
+# Transport errors raised by either HTTP backend
+NETWORK_ERRORS = (RequestException, httpx.HTTPError) if httpx else (RequestException,)
+
+# Errors raised while reading a streamed body from the raw urllib3 response, which requests does not wrap
+STREAM_ERRORS = (urllib3.exceptions.HTTPError, ijson.JSONError) if ijson else (urllib3.exceptions.HTTPError,)
+
+# Every page of a crawl joins the same base URL and path, so the parsing work is memoized
+_urljoin = lru_cache(maxsize=256)(urljoin)
+
+# Pages with a smaller Content-Length are decoded in one go, which is faster than streaming them
+STREAM_THRESHOLD = 1024 * 1024
+
+
+class Paginator(AsyncFetchMixin):
     """
     A class for fetching and paginating JSON data from APIs with support for multithreading,
     customizable authentication, and the option to disable SSL verification for HTTP requests.
     """
 
+    # urllib3 warning filters are process-wide, so they are only installed by the first instance
+    _warnings_disabled = False
+
     def __init__(
         self,
         base_url: str,
@@ -46,7 +82,10 @@ class Paginator:
         ratelimit: Optional[tuple] = None,
         headers: Optional[Dict[str, str]] = None,
         proxies: Optional[Dict[str, Optional[str]]] = None,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        cache_path: Optional[str] = None,
+        flatten_workers: int = 1,
+        http2: bool = False
     ):
         """
         Initializes the Paginator with the given configuration.
@@ -60,16 +99,25 @@ class Paginator:
             current_index_field (str, optional): Field name for the starting index in the API request.
             items_field (str, optional): Field name for the number of items per page in the API request.
             total_count_field (str, optional): Field name in the API response that holds the total number of items.
+                                               Nested fields can be given as a dotted path, e.g. 'meta.total'.
             items_per_page (int, optional): The number of items to request per page.
-            max_threads (int, optional): Maximum number of threads to use for parallel requests.
+            max_threads (int, optional): Maximum number of requests in flight at once. Twice as many worker
+                                         threads are used, so pages waiting to be retried do not take a slot.
             download_one_page_only (bool, optional): Whether to fetch only the first page of data.
             verify_ssl (bool, optional): Whether to verify SSL certificates for HTTP requests.
             data_field (str, optional): Field name from which to extract the data in the API response.
+                                        Nested fields can be given as a dotted path, e.g. 'result.items'.
             log_level (str, optional): Logging level for the paginator.
             retry_delay (int, optional): Time in seconds to wait before retrying a failed request.
             ratelimit (tuple, optional): Rate limit settings as a tuple (calls, period) where 'calls' is the number of allowed calls in 'period' seconds.
             headers (dict, optional): Additional headers to include in the requests.
             logger (logging.Logger, optional): Custom logger instance. If not provided, the default logger is used.
+            cache_path (str, optional): File used to persist ETag/Last-Modified validators and page payloads
+                                        between runs. When set, pages are fetched with conditional requests.
+            flatten_workers (int, optional): Number of processes used to flatten large result sets. Defaults to 1,
+                                             which flattens in the calling process.
+            http2 (bool, optional): Whether to multiplex requests over HTTP/2 using httpx (requires the 'http2'
+                                    extra). Falls back to requests when httpx/h2 is missing or proxies are set.
         """
 
         # Validate pagination fields
@@ -85,7 +133,6 @@ class Paginator:
 
         # URL and Authentication
         self.base_url = base_url
-        # print(f"Base URL set to: {self.base_url}")
         self.login_url = login_url
         self.auth_data = auth_data
         self.token = None
@@ -95,38 +142,47 @@ class Paginator:
         self.verify_ssl = verify_ssl
         self.request_timeout = 120  # Default timeout; can be customized
         self.headers = headers.copy() if headers else {}
-        self.retry_lock = Lock()
-        self.is_retrying = False
         self.proxies = proxies  # This will be None by default, allowing system proxies
 
+        # A single session shared by login and all page fetches so connections are reused across calls
+        self.is_http2 = False
+        self.session = self._create_session(http2, max_threads)
+
+        # Conditional request cache: key + ':v' -> (etag, last_modified), key -> pickled payload,
+        # so that requests answered 200 only read the small validators entry
+        self._etag_cache = shelve.open(cache_path) if cache_path else None
+        self._cache_lock = Lock()
+
         # Pagination Configuration
         self.pagination_field = current_page_field if current_page_field else current_index_field
         self.is_page_based = bool(current_page_field)
         self.items_field = items_field
         self.total_count_field = total_count_field
         self.data_field = data_field
+        # Field paths are split once here rather than on every response
+        self._total_count_path = tuple(total_count_field.split('.')) if total_count_field else ()
+        self._data_path = tuple(data_field.split('.')) if data_field else ()
         self.items_per_page = items_per_page  # Will be set dynamically if not provided
         self.response_items_field = response_items_field
         self.download_one_page_only = download_one_page_only
+        self.flatten_workers = flatten_workers
 
         # Threading Configuration
         self.max_threads = max_threads
+        # Caps requests in flight, bodies included; pages waiting out a retry delay or the rate limit hold a worker thread but not a slot
+        self._http_sem = BoundedSemaphore(max_threads)
         self.retry = 5  # Number of retries for failed requests
         self.retry_delay = retry_delay  # Initial retry delay in seconds
 
         # Rate Limiting Configuration
         self.ratelimit = ratelimit  # Tuple like (5, 60) for 5 calls per 60 seconds
-        if self.ratelimit:
-            self.calls, self.period = self.ratelimit
-            self.rate_semaphore = Semaphore(self.calls)
-            self.rate_period = self.period
-            self.rate_reset_time = time.time() + self.rate_period
-        else:
-            self.rate_semaphore = None
+        self.rate_limiter = SlidingWindowLimiter(*self.ratelimit) if self.ratelimit else None
 
         # Disable SSL warnings if SSL verification is disabled
         if not self.verify_ssl:
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            if not Paginator._warnings_disabled:
+                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+                Paginator._warnings_disabled = True
             self.logger.debug('SSL verification is disabled for all requests.')
 
     def set_log_level(self, log_level: str) -> None:
@@ -140,14 +196,17 @@ class Paginator:
         numeric_level = getattr(logging, log_level.upper(), None)
         if not isinstance(numeric_level, int):
             raise ValueError(f'Invalid log level: {log_level}')
-        self.logger.setLevel(numeric_level)
+        # setLevel clears the level cache of every logger in the process, skip it when nothing changes
+        if self.logger.level != numeric_level:
+            self.logger.setLevel(numeric_level)
 
     def flatten_json(self, y: Any) -> Dict[str, Any]:
         """
         Flattens a nested JSON object into a single level dictionary with keys as paths to nested
         values.
 
-        This method uses a generator to efficiently traverse the nested JSON object.
+        The object is walked iteratively with an explicit stack of (node, path) pairs, so deeply
+        nested payloads do not hit the recursion limit and keys are only joined once per leaf.
 
         Args:
             y (dict or list): The JSON object (or a part of it) to be flattened.
@@ -160,29 +219,187 @@ class Paginator:
             Given a nested JSON object like {"a": {"b": 1, "c": {"d": 2}}},
             the output will be {"a_b": 1, "a_c_d": 2}.
         """
-        def flatten(x: Any, name: str = '') -> Dict[str, Any]:
-            """Recursively flattens a nested structure of dictionaries and lists into a flat dictionary.
-            
-            Args:
-                x (Any): The input structure to be flattened. Can be a dictionary, list, or any other type.
-                name (str, optional): The base name for the current level of recursion. Defaults to ''.
-            
-            Returns:
-                Dict[str, Any]: A flattened dictionary where keys are concatenated paths and values are the leaf nodes.
-            
-            Yields:
-                Tuple[str, Any]: A tuple containing the flattened key and its corresponding value.
-            """
-            if isinstance(x, dict):
-                for a in x:
-                    yield from flatten(x[a], f'{name}{a}_')
-            elif isinstance(x, list):
-                for i, a in enumerate(x):
-                    yield from flatten(a, f'{name}{i}_')
+        return flatten(y)
+
+    def _create_session(self, http2: bool, max_threads: int) -> Any:
+        """
+        Creates the HTTP session shared by all requests of this Paginator.
+
+        Args:
+            http2 (bool): Whether to use an HTTP/2 capable httpx client.
+            max_threads (int): Maximum number of requests in flight, used to size the connection pool.
+
+        Returns:
+            requests.Session or httpx.Client: The configured session.
+        """
+        if http2:
+            if httpx is None:
+                self.logger.warning('HTTP/2 requested but httpx is not installed, falling back to requests.')
+            elif self.proxies:
+                self.logger.warning('HTTP/2 is not supported together with explicit proxies, falling back to requests.')
             else:
-                yield (name[:-1], x)
+                try:
+                    # A single HTTP/2 connection multiplexes every page; the limit only matters
+                    # if the server negotiates HTTP/1.1
+                    client = httpx.Client(
+                        http2=True,
+                        verify=self.verify_ssl,
+                        timeout=self.request_timeout,
+                        headers=self.headers,
+                        limits=httpx.Limits(max_connections=max_threads, max_keepalive_connections=max_threads)
+                    )
+                    self.is_http2 = True
+                    return client
+                except ImportError:
+                    self.logger.warning('HTTP/2 requested but the h2 package is not installed, falling back to requests.')
+
+        # The pool holds one connection per request slot (max_threads) so no socket is discarded
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_threads, pool_maxsize=max_threads, max_retries=0)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        # requests advertises every encoding urllib3 can decode (gzip, deflate, and br when brotli
+        # is installed); keep that default unless the caller supplies their own Accept-Encoding
+        session.headers.update(self.headers)
+        session.verify = self.verify_ssl
+        return session
+
+    def _send(self, session: Any, method: str, url: str, stream: bool = False, **kwargs: Any) -> Any:
+        """
+        Sends a request through either HTTP backend with the configured timeout, adding the options
+        only requests understands.
+
+        Args:
+            session (requests.Session or httpx.Client): The session to send the request with.
+            method (str): The HTTP method.
+            url (str): The absolute URL of the request.
+            stream (bool, optional): Whether to defer downloading the body (requests only).
+            **kwargs: Further arguments for the request, e.g. params, headers or json.
+
+        Returns:
+            requests.Response or httpx.Response: The HTTP response received.
+        """
+        # requests.Session has no session-wide timeout, so it must be passed on every call
+        kwargs.setdefault('timeout', self.request_timeout)
+        if self.is_http2:
+            return session.request(method, url, **kwargs)
+        return session.request(method, url, proxies=self.proxies, stream=stream, **kwargs)
+
+    @staticmethod
+    def _extract(data: Any, path: tuple) -> Any:
+        """
+        Follows a pre-split field path through nested dictionaries.
+
+        Args:
+            data (Any): The decoded JSON response.
+            path (tuple): The keys to follow, as split from a dotted field name.
+
+        Returns:
+            Any: The value at the end of the path, or None if any key along it is missing.
+        """
+        for key in path:
+            if not isinstance(data, dict):
+                return None
+            data = data.get(key)
+        return data
+
+    def close(self) -> None:
+        """
+        Releases resources held by the Paginator: closes the pooled HTTP connections and flushes
+        the conditional request cache to disk.
+        """
+        self.session.close()
+        if self._etag_cache is not None:
+            with self._cache_lock:
+                self._etag_cache.close()
+                self._etag_cache = None
+
+    def __enter__(self) -> 'Paginator':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _cache_key(self, url: str, params: Dict[str, Any]) -> str:
+        """
+        Builds the conditional request cache key for a page request.
+
+        Args:
+            url (str): The absolute URL of the request.
+            params (dict): Query parameters of the request.
 
-        return dict(flatten(y))
+        Returns:
+            str: A stable digest identifying the request.
+        """
+        raw = url + '?' + urlencode(sorted(params.items()))
+        return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _conditional_headers(self, cache_key: str, headers: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        """
+        Adds the stored validators of a request to its headers, so an unchanged response comes
+        back as 304 Not Modified.
+
+        Args:
+            cache_key (str): The cache key of the request.
+            headers (dict, optional): Extra headers of the request.
+
+        Returns:
+            dict or None: The headers to send, `headers` itself if nothing is cached.
+        """
+        with self._cache_lock:
+            validators = self._etag_cache.get(cache_key + ':v')
+        if not validators:
+            return headers
+
+        etag, last_modified = validators
+        request_headers = dict(headers) if headers else {}
+        if etag:
+            request_headers['If-None-Match'] = etag
+        if last_modified:
+            request_headers['If-Modified-Since'] = last_modified
+        return request_headers
+
+    def _cache_load(self, cache_key: Optional[str]) -> Any:
+        """
+        Loads the cached payload of a request answered 304 Not Modified.
+
+        Args:
+            cache_key (str, optional): The cache key of the request, None if the cache is disabled.
+
+        Returns:
+            Any: The payload stored with the validators that were sent.
+
+        Raises:
+            ValueError: If no payload is cached for the request.
+        """
+        blob = None
+        if cache_key is not None:
+            with self._cache_lock:
+                blob = self._etag_cache.get(cache_key)
+        if not isinstance(blob, bytes):
+            raise ValueError('Not Modified response without a cached copy')
+        # Unpickled outside the lock, so concurrent pages do not wait on each other
+        return pickle.loads(blob)
+
+    def _cache_store(self, cache_key: Optional[str], response: Any, data: Any) -> None:
+        """
+        Stores the validators and payload of a 200 response, if the server sent validators.
+
+        Args:
+            cache_key (str, optional): The cache key of the request, None if the cache is disabled.
+            response (requests.Response or httpx.Response): The response carrying the validators.
+            data (Any): The payload to serve on later 304 responses.
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if cache_key is None or not (etag or last_modified):
+            return
+
+        # Pickled outside the lock; storing bytes under it is then only a copy
+        blob = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._cache_lock:
+            self._etag_cache[cache_key] = blob
+            self._etag_cache[cache_key + ':v'] = (etag, last_modified)
 
     def login(self) -> None:
         """
@@ -198,31 +415,35 @@ class Paginator:
             raise ValueError('Login URL and auth data must be provided for login.')
 
         # Check if token is still valid
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         if self.token and self.token_expiry and datetime.now() < self.token_expiry:
-            self.logger.debug('Using cached authentication token.')
+            if debug:
+                self.logger.debug('Using cached authentication token.')
             return  # Token is still valid
 
         login_url = urljoin(self.base_url, self.login_url)
-        self.logger.debug('Logging in to %s', login_url)
+        if debug:
+            self.logger.debug('Logging in to %s', login_url)
 
         try:
-            response = requests.post(
+            response = self._send(
+                self.session,
+                'POST',
                 login_url,
-                json=self.auth_data,
-                verify=self.verify_ssl,
-                timeout=self.request_timeout,
-                proxies=self.proxies
+                json=self.auth_data
             )
-            self.logger.debug('Login request to %s returned status code %d', login_url, response.status_code)
+            if debug:
+                self.logger.debug('Login request to %s returned status code %d', login_url, response.status_code)
 
             if response.status_code == 200:
-                json_response = response.json()
+                json_response = _loads(response.content)
                 self.token = json_response.get('token')
                 if not self.token:
                     self.logger.error('Token not found in login response.')
                     raise LoginFailedException(response.status_code, 'Token not found in response.')
 
                 self.headers['Authorization'] = f'Bearer {self.token}'
+                self.session.headers['Authorization'] = self.headers['Authorization']
 
                 # Assume the token expires in 'expires_in' seconds if provided
                 expires_in = json_response.get('expires_in', 3600)  # Default to 1 hour
@@ -230,12 +451,15 @@ class Paginator:
                 self.logger.info('Login successful. Token expires at %s.', self.token_expiry)
 
             else:
-                self.logger.error('Login failed with status code %d: %s', response.status_code, response.text)
+                self.logger.error('Login failed with status code %d: %s', response.status_code, response.text[:MAX_LOGGED_BODY])
                 raise LoginFailedException(response.status_code, response.text)
 
-        except RequestException as e:
+        except NETWORK_ERRORS as e:
             self.logger.error('Network error during login: %s', e)
             raise LoginFailedException(0, str(e)) from e
+        except ValueError as e:
+            self.logger.error('Invalid JSON in login response: %s', e)
+            raise LoginFailedException(response.status_code, f'Invalid JSON in login response: {e}') from e
 
     def ensure_authenticated(self) -> None:
         """
@@ -246,29 +470,38 @@ class Paginator:
             if not self.token or (self.token_expiry and datetime.now() >= self.token_expiry):
                 self.login()
 
+    def warm_up(self, url: Optional[str] = None) -> None:
+        """
+        Opens the pooled connections ahead of a crawl by sending concurrent HEAD requests, so the
+        first pages are served over keep-alive sockets that already completed their TCP/TLS handshake.
+
+        Failures are only logged; the probes go through the rate limiter like any other request.
+
+        Args:
+            url (str, optional): URL to probe, relative to `base_url`. Defaults to the root of `base_url`.
+        """
+        target = urljoin(self.base_url, url or '/')
+        # One HTTP/2 connection carries every request, HTTP/1.1 needs one socket per worker
+        connections = 1 if self.is_http2 else self.max_threads
+
+        def probe(_: int) -> None:
+            self.enforce_ratelimit()
+            try:
+                self._send(self.session, 'HEAD', target).close()
+            except NETWORK_ERRORS as e:
+                self.logger.debug('Warm-up request to %s failed: %s', target, e)
+
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            list(executor.map(probe, range(connections)))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('Warmed up %d connection(s) to %s', connections, target)
+
     def enforce_ratelimit(self) -> None:
         """
-        Enforces the rate limit by acquiring a semaphore or sleeping if necessary before making the next request.
-        """
-        if self.ratelimit:
-            with self.retry_lock:
-                current_time = time.time()
-                if current_time >= self.rate_reset_time:
-                    # Reset the semaphore and the reset time
-                    self.rate_semaphore = Semaphore(self.calls)
-                    self.rate_reset_time = current_time + self.rate_period
-                    self.logger.debug('Rate limit reset.')
-
-            acquired = self.rate_semaphore.acquire(timeout=self.rate_period)
-            if not acquired:
-                sleep_time = self.rate_reset_time - time.time()
-                if sleep_time > 0:
-                    self.logger.debug('Rate limit exceeded, sleeping for %.2f seconds', sleep_time)
-                    time.sleep(sleep_time)
-                # After sleeping, reset the semaphore
-                with self.retry_lock:
-                    self.rate_semaphore = Semaphore(self.calls)
-                    self.rate_reset_time = time.time() + self.rate_period
+        Enforces the rate limit, sleeping until the request fits in the rate limit window if necessary.
+        """
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
 
     def make_request(
         self,
@@ -276,34 +509,40 @@ class Paginator:
         method: str,
         url: str,
         params: Dict[str, Any],
-        page: int
+        page: int,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False
     ) -> requests.Response:
         """
         Makes an HTTP request using the provided session.
 
+        The rate limit is not enforced here: callers call `enforce_ratelimit` first, before taking
+        a request slot, so that waiting for the rate limit does not hold one.
+
         Args:
             session (requests.Session): The session to use for making the request.
             method (str): The HTTP method (e.g., 'GET', 'POST').
             url (str): The URL for the request.
             params (dict): Query parameters for the request.
             page (int): The page number being requested (for logging purposes).
+            headers (dict, optional): Extra headers for this request only.
+            stream (bool, optional): Whether to defer downloading the response body.
 
         Returns:
             requests.Response: The HTTP response received.
 
         Raises:
-            RequestException: If an error occurs during the request.
+            RequestException: If an error occurs during the request (httpx.HTTPError with the HTTP/2 backend).
         """
-        self.enforce_ratelimit()
-
-        full_url = urljoin(self.base_url, url)
-        # print(f"Making {method} request to URL: {full_url} with params: {params}")
+        full_url = _urljoin(self.base_url, url)
 
         try:
-            response = session.request(method, full_url, params=params, proxies=self.proxies)
-            self.logger.debug('Requesting URL: %s with status code: %d', response.url, response.status_code)
+            response = self._send(session, method, full_url, stream, params=params, headers=headers)
+            # Skip building the log arguments on the per-page hot path unless DEBUG is enabled
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug('Requesting URL: %s with status code: %d', response.url, response.status_code)
             return response
-        except RequestException as e:
+        except NETWORK_ERRORS as e:
             self.logger.error('Network error during request to page %d: %s', page, e)
             raise
 
@@ -313,73 +552,271 @@ class Paginator:
         url: str,
         params: Dict[str, Any],
         page: int,
-        results: List[Any],
+        results: List[Optional[List[Any]]],
         pbar: Optional[tqdm] = None,
-        callback: Optional[Callable[[List[Any]], None]] = None
-    ) -> None:
+        callback: Optional[Callable[[List[Any]], None]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> int:
         """
         Fetches a single page of data from the API and updates the progress bar.
 
-        Implements exponential backoff for retries.
+        Failed attempts are retried with exponential backoff, as decided by `PageRetry`.
 
         Args:
             session (requests.Session): The session to use for making requests.
             url (str): The API endpoint URL.
             params (dict): Additional parameters to pass in the request.
             page (int): The page number to fetch.
-            results (list): The list to which fetched data will be appended.
+            results (list): Per-page result slots; the page data is stored at index `page - 1`.
             pbar (tqdm, optional): A tqdm progress bar instance to update with progress.
             callback (function, optional): A callback function to be invoked after each page is fetched.
+            headers (dict, optional): Extra headers for this request only, on top of the session headers.
+
+        Returns:
+            int: The number of items fetched for this page.
         """
-        retries = self.retry
-        backoff_factor = 2  # Exponential backoff factor
+        attempts = self._page_retry(page)
+
+        # Send the stored validators so unchanged pages come back as 304 Not Modified
+        cache_key = None
+        request_headers = headers
+        if self._etag_cache is not None:
+            cache_key = self._cache_key(_urljoin(self.base_url, url), params)
+            request_headers = self._conditional_headers(cache_key, headers)
+
+        # Parse the data field of large pages incrementally instead of materializing the whole envelope
+        use_stream = ijson is not None and bool(self._data_path) and not self.is_http2
 
-        while retries > 0:
+        while True:
+            # Wait for the rate limit before taking a slot, so idle waits never block another page's transfer
+            self.enforce_ratelimit()
             try:
-                response = self.make_request(session, 'GET', url, params, page)
+                # The slot is held until the body has been read, streamed or not, so that max_threads
+                # caps the transfers in flight; it is released before any retry delay
+                with self._http_sem:
+                    response = self.make_request(session, 'GET', url, params, page, request_headers, use_stream)
 
-                if response.status_code == 200:
-                    data = response.json()
-                    fetched_data = data.get(self.data_field, []) if self.data_field else data
+                    if response.status_code in (200, 304):
+                        fetched_data = self._read_page(response, page, cache_key, use_stream)
+                        break  # Success, the page is stored below
 
-                    with self.retry_lock:
-                        results.extend(fetched_data)
+                    # Read the error body within the slot too; it is only logged
+                    error_text = response.text[:MAX_LOGGED_BODY]
 
-                    if callback:
-                        callback(fetched_data)
+                delay = attempts.after_status(response.status_code, retry_after_delay(response), error_text)
+            except NETWORK_ERRORS as e:
+                delay = attempts.after_error('Network error fetching page %d: %s', e)
+            except STREAM_ERRORS as e:
+                delay = attempts.after_error('Error reading the body of page %d: %s', e)
+            except ValueError as e:
+                # A 200 with an HTML error page or a truncated body is retried like a network error
+                delay = attempts.after_error('Invalid JSON in page %d: %s', e)
 
-                    if pbar:
-                        pbar.update(len(fetched_data))
+            time.sleep(delay)
 
-                    return  # Success, exit the function
+        if response.status_code == 200:
+            self._cache_store(cache_key, response, fetched_data)
 
-                elif response.status_code == 401:
-                    self.logger.error('Authentication failed with status code %d: %s', response.status_code, response.text)
-                    raise AuthenticationFailed(f"Authentication failed with status code {response.status_code}")
+        # Each page owns its slot, and list item assignment is atomic, so no lock is needed
+        results[page - 1] = fetched_data
 
-                elif response.status_code == 403:
-                    if not self.login_url:
-                        self.logger.warning('Access denied with status code 403, retrying after 10 seconds...')
-                        time.sleep(10)
-                        continue  # Retry after sleeping
-                    else:
-                        self.logger.error('Access denied with status code %d: %s', response.status_code, response.text)
-                        raise AuthenticationFailed(f"Access denied with status code {response.status_code}")
+        if callback:
+            callback(fetched_data)
 
-                else:
-                    self.logger.warning('Failed to fetch page %d with status code %d: %s', page, response.status_code, response.text)
+        if pbar:
+            pbar.update(len(fetched_data))
+
+        return len(fetched_data)
+
+    def _read_page(self, response: Any, page: int, cache_key: Optional[str], use_stream: bool) -> Any:
+        """
+        Reads the items of a successful (200 or 304) page response.
+
+        Args:
+            response (requests.Response or httpx.Response): The page response.
+            page (int): The page number, for logging.
+            cache_key (str, optional): The conditional request cache key of the page, None if the cache is disabled.
+            use_stream (bool): Whether the response was requested with stream=True for ijson.
+
+        Returns:
+            Any: The items of the page, as `_extract_page` returns them.
+
+        Raises:
+            ValueError: If the body is not valid JSON, or a 304 has no cached copy.
+        """
+        if response.status_code == 304:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug('Page %d not modified, using cached data.', page)
+            return self._cache_load(cache_key)
+
+        if use_stream and int(response.headers.get('Content-Length') or STREAM_THRESHOLD) >= STREAM_THRESHOLD:
+            # Headers arrive before the body, so the parser can be chosen from the announced size
+            response.raw.decode_content = True
+            try:
+                # The value under data_field as a whole, list or object, like _extract_page returns it
+                fetched_data = next(ijson.items(response.raw, self.data_field, use_float=True), None)
+            finally:
+                response.close()
+            return [] if fetched_data is None else fetched_data
+
+        return self._extract_page(_loads(response.content))
+
+    def _page_retry(self, page: int) -> PageRetry:
+        """
+        Starts tracking the attempts at a page with this Paginator's retry settings.
+
+        Args:
+            page (int): The page about to be fetched.
+
+        Returns:
+            PageRetry: The retry state of the page.
+        """
+        return PageRetry(page, self.retry, self.retry_delay, self.logger, bool(self.login_url))
+
+    def _first_page_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Builds the params of the initial request, which doubles as the request for page 1.
+
+        Args:
+            params (dict): The caller's query parameters.
+
+        Returns:
+            dict: The query parameters for page 1.
+        """
+        first_page_params = dict(params)
+        first_page_params[self.pagination_field] = 1 if self.is_page_based else 0
+        if self.items_field and self.items_per_page:
+            first_page_params[self.items_field] = self.items_per_page
+        return first_page_params
+
+    def _page_params_factory(self, params: Dict[str, Any]) -> Callable[[int], Dict[str, Any]]:
+        """
+        Returns a function building the query parameters of a page from one shared base dict.
+
+        Args:
+            params (dict): The caller's query parameters.
+
+        Returns:
+            function: Maps a page number to its query parameters.
+        """
+        base_params = dict(params)
+        if self.items_field:
+            base_params[self.items_field] = self.items_per_page
+        page_key = self.pagination_field
+        is_page_based = self.is_page_based
+        items_per_page = self.items_per_page
 
-            except RequestException as e:
-                self.logger.error('Network error fetching page %d: %s', page, e)
+        def page_params(page: int) -> Dict[str, Any]:
+            return {**base_params, page_key: page if is_page_based else (page - 1) * items_per_page}
 
-            retries -= 1
-            if retries > 0:
-                backoff = self.retry_delay * (backoff_factor ** (self.retry - retries))
-                self.logger.warning('Retrying page %d after %.2f seconds, remaining retries: %d', page, backoff, retries)
-                time.sleep(backoff)
+        return page_params
+
+    def _plan_pages(self, json_data: Any) -> Optional[tuple]:
+        """
+        Works out the pagination from the first response, setting `items_per_page` if unknown.
+
+        Args:
+            json_data (Any): The decoded first response.
+
+        Returns:
+            tuple or None: (total_count, total_pages), or None if the response is not paginated.
+        """
+        if not isinstance(json_data, dict):
+            # Not an envelope (e.g. a bare list), so there is nothing to paginate
+            return None
+
+        total_count = self._extract(json_data, self._total_count_path) if self._total_count_path else None
+        if total_count is None:
+            self.logger.warning('Total count field "%s" missing, cannot paginate properly.', self.total_count_field)
+            return None
+
+        # Set items_per_page based on the initial API call if not set
+        if not self.items_per_page:
+            if self.response_items_field and self.response_items_field in json_data:
+                self.items_per_page = json_data.get(self.response_items_field)
+            elif self.items_field and self.items_field in json_data:
+                self.items_per_page = json_data.get(self.items_field)
             else:
-                self.logger.error('Failed to fetch page %d after multiple retries.', page)
-                raise DataFetchFailedException(page, f'Failed to fetch page {page} after retries.')
+                # Page 1 was served with the server's default page size, so the following pages
+                # must use the same size or items would be skipped
+                first_page = self._extract_page(json_data)
+                self.items_per_page = len(first_page) if isinstance(first_page, list) else 0
+
+        if not self.items_per_page:
+            self.logger.warning('items_per_page is 0, returning an empty result.')
+            return total_count, 0
+
+        # Calculate total_pages based on total_count and items_per_page (integer ceiling division)
+        total_pages = 1 if self.download_one_page_only else max((total_count + self.items_per_page - 1) // self.items_per_page, 1)
+        self.logger.info('Total items to download: %d | Number of pages to fetch: %d', total_count, total_pages)
+        return total_count, total_pages
+
+    def _extract_page(self, json_data: Any) -> Any:
+        """
+        Extracts the items of a page from its decoded response.
+
+        Args:
+            json_data (Any): The decoded response.
+
+        Returns:
+            Any: The value under `data_field`, the whole response if no data field is set, or an
+                 empty list if the field is missing.
+        """
+        if not self._data_path:
+            return json_data
+        fetched_data = self._extract(json_data, self._data_path)
+        return [] if fetched_data is None else fetched_data
+
+    def _start_crawl(self, json_data: Any, flatten_json: bool, callback: Optional[Callable[[Any], None]], return_format: str) -> tuple:
+        """
+        Plans the crawl from the initial response, which doubles as page 1, and hands page 1 to the callback.
+
+        Args:
+            json_data (Any): The decoded initial response.
+            flatten_json (bool): Whether results are flattened.
+            callback (function, optional): Invoked with the items of page 1.
+            return_format (str): Layout of the result.
+
+        Returns:
+            tuple: (first_page, total_count, total_pages). When the response is not paginated or is
+                   empty, total_pages is 0 and the first element is the final result instead.
+        """
+        plan = self._plan_pages(json_data)
+        if plan is None:
+            return self._single_response(json_data, flatten_json, callback, return_format), 0, 0
+        total_count, total_pages = plan
+        if not total_pages:
+            return convert([], return_format), total_count, 0
+
+        first_page = self._extract_page(json_data)
+        if callback:
+            callback(first_page)
+        return first_page, total_count, total_pages
+
+    @staticmethod
+    def _single_response(
+        json_data: Any,
+        flatten_json: bool,
+        callback: Optional[Callable[[Any], None]],
+        return_format: str = 'list'
+    ) -> Any:
+        """
+        Returns the payload of a non-paginated response as-is, without setting up any workers.
+
+        Args:
+            json_data (Any): The decoded response.
+            flatten_json (bool): Whether to flatten the payload; lists are flattened item by item.
+            callback (function, optional): Invoked once with the payload.
+            return_format (str, optional): Layout applied when the payload is a list. Defaults to 'list'.
+
+        Returns:
+            Any: The payload, flattened if requested.
+        """
+        if callback:
+            callback(json_data)
+        if isinstance(json_data, list):
+            return convert(flatten_items(json_data) if flatten_json else json_data, return_format)
+        return flatten(json_data) if flatten_json else json_data
 
     def _log_error_details(self, response: requests.Response) -> None:
         """
@@ -391,8 +828,8 @@ class Paginator:
         full_url = response.url
         self.logger.error('Failed to fetch data from %s', full_url)
         self.logger.error('HTTP status code: %d', response.status_code)
-        self.logger.error('Response reason: %s', response.reason)
-        self.logger.error('Response content: %s', response.text)
+        self.logger.error('Response reason: %s', getattr(response, 'reason', None) or getattr(response, 'reason_phrase', ''))
+        self.logger.error('Response content: %s', response.text[:MAX_LOGGED_BODY])
         self.logger.error('Request headers: %s', response.request.headers)
 
     def fetch_all_pages(
@@ -401,8 +838,9 @@ class Paginator:
         params: Optional[Dict[str, Any]] = None,
         flatten_json: bool = False,
         headers: Optional[Dict[str, str]] = None,
-        callback: Optional[Callable[[List[Any]], None]] = None
-    ) -> List[Any]:
+        callback: Optional[Callable[[List[Any]], None]] = None,
+        return_format: str = 'list'
+    ) -> Any:
         """
         Fetches all pages of data from a paginated API endpoint, optionally flattening the JSON
         structure of the results. Invokes a callback function after each page if provided.
@@ -412,104 +850,116 @@ class Paginator:
             params (dict, optional): Additional query parameters to include in the request.
             flatten_json (bool, optional): If set to True, the returned JSON structure will be
                                         flattened. Defaults to False.
+            headers (dict, optional): Extra headers sent with this call's requests only.
             callback (function, optional): A callback function that is called after each page is fetched.
+            return_format (str, optional): Layout of the result: 'list' (default) for a list of items, 'soa'
+                                           for a dictionary of columns, or 'arrow' for a `pyarrow.Table`
+                                           (requires the 'arrow' extra).
 
         Returns:
             list: A list of JSON objects fetched from the API. If `flatten_json` is True, each item is a flattened dictionary.
+                  With `return_format` 'soa' or 'arrow', the same items laid out by column.
         """
+        check_return_format(return_format)
         if not params:
             params = {}
-        
-        # Ensure authentication before copying headers
-        self.ensure_authenticated()  # Ensure authentication before making requests
-
-        # Merge instance headers with method-specific headers, if any
-        effective_headers = self.headers.copy()
-        if headers:
-            effective_headers.update(headers)
 
-        # Initialize a session for connection pooling
-        with requests.Session() as session:
-            session.headers.update(effective_headers)
-            session.verify = self.verify_ssl
-            session.timeout = self.request_timeout
+        self.ensure_authenticated()  # Ensure authentication before making requests
+        session = self.session
 
-            # Initial request to get total_count
-            try:
-                initial_response = session.get(urljoin(self.base_url, url), params=params, proxies=self.proxies)
+        try:
+            first_url = urljoin(self.base_url, url)
+            first_params = self._first_page_params(params)
+            # The whole first response is cached, not only its items, since it also plans the crawl
+            cache_key = None
+            request_headers = headers
+            if self._etag_cache is not None:
+                cache_key = 'first:' + self._cache_key(first_url, first_params)
+                request_headers = self._conditional_headers(cache_key, headers)
+
+            # The initial request is page 1, so it takes a token like every other page
+            self.enforce_ratelimit()
+            initial_response = self._send(session, 'GET', first_url, params=first_params, headers=request_headers)
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug('Initial request to %s returned status code %d', initial_response.url, initial_response.status_code)
+                self.logger.debug('Response Content-Encoding: %s', initial_response.headers.get('Content-Encoding', 'identity'))
 
-                if initial_response.status_code != 200:
-                    self._log_error_details(initial_response)
-                    raise DataFetchFailedException(initial_response.status_code, initial_response.url, initial_response.text)
-
-                json_data = initial_response.json()
-                
-                if isinstance(json_data, dict):
-                    data = json_data.get('data', [])
-                    total_count = json_data.get(self.total_count_field, None)
-
-                    if total_count is None:
-                        self.logger.warning('Total count field "%s" missing, cannot paginate properly.', self.total_count_field)
-                        return self.flatten_json(json_data) if flatten_json else json_data
+            if initial_response.status_code not in (200, 304):
+                self._log_error_details(initial_response)
+                raise DataFetchFailedException(initial_response.status_code, initial_response.url, initial_response.text)
 
+            try:
+                if initial_response.status_code == 304:
+                    json_data = self._cache_load(cache_key)
                 else:
-                    # self.logger.error('Expected a dictionary but received a different type.')
-                    return self.flatten_json(json_data) if flatten_json else json_data
-
-
-                # Set items_per_page based on the initial API call if not set
-                if not self.items_per_page:
-                    if self.response_items_field and self.response_items_field in json_data:
-                        self.items_per_page = json_data.get(self.response_items_field)
-                    else:
-                        self.items_per_page = json_data.get(self.items_field, 50)  # Default to 50
-
-                if self.items_per_page == 0:
-                    self.logger.warning('items_per_page is 0, returning an empty result.')
-                    return []
-
-                # Calculate total_pages based on total_count and items_per_page
-                total_pages = 1 if self.download_one_page_only else math.ceil(total_count / self.items_per_page)
-                self.logger.info('Total items to download: %d | Number of pages to fetch: %d', total_count, total_pages)
-
-                results: List[Any] = []
-
-                # Initialize progress bar
-                with tqdm(total=total_count, desc='Downloading items') as pbar, ThreadPoolExecutor(max_workers=self.max_threads) as executor:
-                    # Create a dictionary to map futures to page numbers
-                    future_to_page = {
-                        executor.submit(
-                            self.fetch_page,
-                            session,
-                            url,
-                            {
-                                **params,
-                                self.pagination_field: page if self.is_page_based else (page - 1) * self.items_per_page,
-                                self.items_field: self.items_per_page
-                            },
-                            page,
-                            results,
-                            pbar,
-                            callback
-                        ): page for page in range(1, total_pages + 1)
-                    }
-
-                    for future in as_completed(future_to_page):
-                        page = future_to_page[future]
-                        try:
-                            future.result()
-                        except Exception as exc:
-                            self.logger.error('Page %d generated an exception: %s', page, exc)
-                            # Depending on requirements, you might choose to continue or raise
-                            raise
-
-                # Optionally flatten JSON if required
-                if flatten_json:
-                    results = [self.flatten_json(item) for item in results]
-
-                return results
-
-            except RequestException as e:
-                self.logger.error('Network error during initial request: %s', e)
-                raise DataFetchFailedException(0, url, str(e)) from e
+                    json_data = _loads(initial_response.content)
+            except ValueError as e:
+                self.logger.error('Invalid JSON in initial response from %s: %s', initial_response.url, e)
+                raise DataFetchFailedException(initial_response.status_code, initial_response.url, f'Invalid JSON: {e}') from e
+
+            if initial_response.status_code == 200:
+                self._cache_store(cache_key, initial_response, json_data)
+
+            first_page, total_count, total_pages = self._start_crawl(json_data, flatten_json, callback, return_format)
+            if not total_pages:
+                return first_page  # Not paginated or empty, this is already the result
+
+            # One slot per page, written by the worker that fetched it, so pages keep their order
+            pages_data: List[Optional[List[Any]]] = [None] * total_pages
+            pages_data[0] = first_page
+
+            if total_pages > 1:
+                # Initialize progress bar; only this thread updates it, from the results of completed pages
+                progress = tqdm(total=total_count, desc='Downloading items', mininterval=0.5, miniters=max(1, total_count // 200))
+                # Extra workers keep max_threads requests in flight while other pages sleep before a retry
+                workers = self.max_threads * 2
+                with progress as pbar, ThreadPoolExecutor(max_workers=workers) as executor:
+                    pbar.update(len(first_page))
+
+                    # Page params are built only when a page is submitted
+                    page_params = self._page_params_factory(params)
+                    # Bound once rather than looked up for every submitted page
+                    fetch_page = self.fetch_page
+                    submit_task = executor.submit
+
+                    def submit(page: int) -> Future:
+                        return submit_task(fetch_page, session, url, page_params(page), page, pages_data, None, callback, headers)
+
+                    # Keep a bounded window of submitted pages and top it up as pages complete, so
+                    # large crawls never hold a future and params dict for every page at once
+                    pages = iter(range(2, total_pages + 1))
+                    future_to_page = {submit(page): page for page in itertools.islice(pages, workers * 2)}
+
+                    while future_to_page:
+                        done, _ = wait(future_to_page, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            page = future_to_page.pop(future)
+                            try:
+                                pbar.update(future.result())
+                            except Exception as exc:
+                                self.logger.error('Page %d generated an exception: %s', page, exc)
+                                # Drop the pages that have not started yet, otherwise leaving the executor
+                                # block would wait for every remaining page to download before raising
+                                for pending in future_to_page:
+                                    pending.cancel()
+                                raise
+
+                            next_page = next(pages, None)
+                            if next_page is not None:
+                                future_to_page[submit(next_page)] = next_page
+
+                if self._etag_cache is not None:
+                    with self._cache_lock:
+                        self._etag_cache.sync()
+
+            results: List[Any] = list(itertools.chain.from_iterable(data for data in pages_data if data is not None))
+
+            # Optionally flatten JSON if required
+            if flatten_json:
+                results = flatten_items(results, self.flatten_workers)
+
+            return convert(results, return_format)
+
+        except NETWORK_ERRORS as e:
+            self.logger.error('Network error during initial request: %s', e)
+            raise DataFetchFailedException(0, url, str(e)) from e
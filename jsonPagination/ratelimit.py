@@ -0,0 +1,75 @@
+"""
+Provides a thread-safe sliding-window limiter used to pace requests against an API rate limit.
+
+The limiter keeps the start times of the last `calls` requests, so that no window of `period`
+seconds, wherever it starts, ever contains more than `calls` requests. This matches APIs that
+enforce rolling windows: a burst of `calls` requests goes out at once, and the next request waits
+until the oldest one leaves the window. Callers reserve their start time under the lock and each
+sleeps exactly until its own slot is due, so waiting threads are released one by one rather than
+all waking up to race for the same slot.
+"""
+
+import time
+from collections import deque
+from threading import Lock
+
+
+class SlidingWindowLimiter:
+    """
+    A thread-safe limiter allowing at most `calls` requests in any window of `period` seconds.
+
+    Attributes:
+        calls (int): Number of requests allowed per window.
+        period (float): Length of the window in seconds.
+        starts (deque): Monotonic start times of the last `calls` requests, oldest first.
+    """
+
+    def __init__(self, calls: int, period: float):
+        """
+        Initialize a limiter allowing `calls` requests per `period` seconds.
+
+        Args:
+            calls (int): Number of requests allowed per window.
+            period (float): Length of the window in seconds.
+        """
+        # Fractional calls are truncated, so they must still allow at least one call per window
+        if int(calls) < 1 or period <= 0:
+            raise ValueError('Rate limit calls must be at least 1 and period must be positive.')
+
+        self.calls = int(calls)
+        self.period = float(period)
+        self.starts: deque = deque(maxlen=self.calls)
+        self.lock = Lock()
+
+    def reserve(self, n: int = 1) -> float:
+        """
+        Books the start time of `n` requests, the earliest allowed by the window.
+
+        Args:
+            n (int, optional): Number of requests to book. Defaults to 1.
+
+        Returns:
+            float: Seconds the caller must wait before its requests may start.
+        """
+        with self.lock:
+            now = time.monotonic()
+            start = now
+            for _ in range(n):
+                if len(self.starts) == self.calls:
+                    # The request `calls` places back must have left the window first
+                    start = max(start, self.starts[0] + self.period)
+                self.starts.append(start)
+            return start - now
+
+    def acquire(self, n: int = 1) -> None:
+        """
+        Blocks until `n` requests may start without exceeding the limit.
+
+        The lock is only held while booking, never while sleeping.
+
+        Args:
+            n (int, optional): Number of requests to book. Defaults to 1.
+        """
+        wait = self.reserve(n)
+        if wait > 0:
+            time.sleep(wait)
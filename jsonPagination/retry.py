@@ -0,0 +1,169 @@
+"""
+Retry decisions shared by the threaded and asyncio page fetchers.
+
+After each failed attempt at a page, `PageRetry` decides whether to give up or how long to wait
+before the next attempt. The fetchers only differ in how they wait, so the rules for 401, 403,
+429, 503 and other failures live here once.
+"""
+
+import logging
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional
+
+from .exceptions import AuthenticationFailed, DataFetchFailedException
+
+# Error responses can be whole HTML pages, only their beginning is logged
+MAX_LOGGED_BODY = 512
+
+# Throttled responses do not spend retries, but a server that never stops throttling must still fail
+MAX_THROTTLED = 20
+
+
+def retry_after_delay(response: Any) -> Optional[float]:
+    """
+    Parses the Retry-After header of a requests, httpx or aiohttp response.
+
+    Args:
+        response: The throttled HTTP response.
+
+    Returns:
+        float or None: Seconds to wait, or None if the header is missing or invalid.
+    """
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    # Otherwise the header is an HTTP-date
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class PageRetry:
+    """
+    Tracks the attempts at one page.
+
+    Attributes:
+        page (int): The page being fetched, for logging.
+        retries (int): Number of failed attempts still allowed.
+        throttled (int): Number of 429 responses received, which do not spend retries.
+    """
+
+    def __init__(self, page: int, retry: int, retry_delay: float, logger: logging.Logger, login_required: bool):
+        """
+        Initialize the attempts at a page.
+
+        Args:
+            page (int): The page being fetched.
+            retry (int): Number of failed attempts allowed.
+            retry_delay (float): Base delay in seconds of the exponential backoff.
+            logger (logging.Logger): Logger of the paginator.
+            login_required (bool): Whether the paginator logs in, in which case a 403 is final.
+        """
+        self.page = page
+        self.retry = retry
+        self.retries = retry
+        self.retry_delay = retry_delay
+        self.throttled = 0
+        self.logger = logger
+        self.login_required = login_required
+
+    def after_status(self, status: int, retry_after: Optional[float], error_text: str) -> float:
+        """
+        Handles a response that did not carry the page.
+
+        Throttling (429) and, without a login, access denied (403) are waited out without spending
+        a retry; authentication failures are final; any other status spends a retry.
+
+        Args:
+            status (int): The HTTP status code.
+            retry_after (float, optional): The parsed Retry-After header of the response.
+            error_text (str): The response body, only logged.
+
+        Returns:
+            float: Seconds to wait before the next attempt.
+
+        Raises:
+            AuthenticationFailed: On 401, or on 403 when logged in.
+            DataFetchFailedException: When no retries are left, or after `MAX_THROTTLED` throttled responses.
+        """
+        error_text = error_text[:MAX_LOGGED_BODY]
+        if status == 401:
+            self.logger.error('Authentication failed with status code %d: %s', status, error_text)
+            raise AuthenticationFailed(f"Authentication failed with status code {status}")
+
+        if status == 429:
+            # Throttling is not a failure: wait as instructed without spending a retry
+            if self.throttled >= MAX_THROTTLED:
+                self.logger.error('Page %d still rate limited after %d attempts, giving up.', self.page, self.throttled)
+                raise DataFetchFailedException(self.page, f'Page {self.page} rate limited {self.throttled} times.')
+            delay = retry_after if retry_after is not None else min(60, 2 ** self.throttled)
+            self.throttled += 1
+            self.logger.warning('Rate limited on page %d, retrying after %.2f seconds...', self.page, delay)
+            return delay
+
+        if status == 403:
+            if self.login_required:
+                self.logger.error('Access denied with status code %d: %s', status, error_text)
+                raise AuthenticationFailed(f"Access denied with status code {status}")
+            self.logger.warning('Access denied with status code 403, retrying after 10 seconds...')
+            return 10.0
+
+        self.logger.warning('Failed to fetch page %d with status code %d: %s', self.page, status, error_text)
+        # A 503 carrying Retry-After is waited out exactly
+        return self._spend_retry(retry_after if status == 503 else None)
+
+    def after_error(self, message: str, error: BaseException) -> float:
+        """
+        Handles an attempt that raised, e.g. a network error or an undecodable body.
+
+        Args:
+            message (str): Log message, formatted with the page and the error.
+            error (BaseException): The error raised by the attempt.
+
+        Returns:
+            float: Seconds to wait before the next attempt.
+
+        Raises:
+            DataFetchFailedException: When no retries are left.
+        """
+        self.logger.error(message, self.page, error)
+        return self._spend_retry(None)
+
+    def _spend_retry(self, retry_after: Optional[float]) -> float:
+        """
+        Counts a failed attempt and computes the delay before the next one.
+
+        Without a Retry-After, this is exponential backoff with full jitter, capped at four times
+        `retry_delay`, so pages that failed together do not all retry at the same instant.
+
+        Args:
+            retry_after (float, optional): Delay requested by the server.
+
+        Returns:
+            float: Seconds to wait before the next attempt.
+
+        Raises:
+            DataFetchFailedException: When no retries are left.
+        """
+        self.retries -= 1
+        if self.retries <= 0:
+            self.logger.error('Failed to fetch page %d after multiple retries.', self.page)
+            raise DataFetchFailedException(self.page, f'Failed to fetch page {self.page} after retries.')
+
+        if retry_after is not None:
+            backoff = retry_after
+        else:
+            backoff = random.uniform(0, min(self.retry_delay * 4, self.retry_delay * 2 ** (self.retry - self.retries)))
+        self.logger.warning('Retrying page %d after %.2f seconds, remaining retries: %d', self.page, backoff, self.retries)
+        return backoff
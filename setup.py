@@ -25,6 +25,13 @@ setup(
         'requests>=2.28.0',
         'tqdm>=4.65.0'
     ],
+    extras_require={
+        'arrow': ['pyarrow>=7.0'],
+        'async': ['aiohttp>=3.8'],
+        'http2': ['httpx[http2]>=0.23'],
+        'speedups': ['orjson>=3.6', 'brotli>=1.0.9'],
+        'stream': ['ijson>=3.1'],
+    },
     classifiers=[
         'Programming Language :: Python :: 3',
         'Programming Language :: Python :: 3.8',